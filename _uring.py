@@ -0,0 +1,280 @@
+import errno
+import os
+import queue
+import shutil
+import threading
+from collections import deque
+from concurrent.futures import Future
+
+try:
+    import liburing
+except ImportError:
+    liburing = None
+
+# The calls below follow the Ring/Cqe API of recent liburing releases, where
+# prep_read/prep_write take the buffer length as nbytes and CQE.res raises
+# OSError for negative results. Older releases exposed a different API.
+if liburing is not None and not hasattr(liburing, "Ring"):
+    liburing = None
+
+URING_CHUNK_SIZE = 1024 * 1024
+URING_QUEUE_DEPTH = 64
+URING_OPEN_BATCH = 1024
+
+
+def available():
+    """
+    Tells whether the io_uring copy backend can be used.
+
+    Returns:
+        bool: True if a supported liburing package is installed.
+    """
+    return liburing is not None
+
+
+class UringOp:
+    """
+    A chunk of a file copy: a read at offset from the source followed by a
+    linked write of the same bytes at offset in the target.
+    """
+
+    __slots__ = ("job", "offset", "size", "buf", "pending")
+
+    def __init__(self, job, offset, size):
+        self.job = job
+        self.offset = offset
+        self.size = size
+        self.buf = None
+        self.pending = 0
+
+
+class _CopyJob:
+    """
+    A file copy handed to the ring thread, completed through its future.
+    """
+
+    __slots__ = ("src", "dst", "future", "in_fd", "out_fd", "pending", "error")
+
+    def __init__(self, src, dst):
+        self.src = src
+        self.dst = dst
+        self.future = Future()
+        self.in_fd = None
+        self.out_fd = None
+        self.pending = 0
+        self.error = None
+
+
+def _copy_range(in_fd, out_fd, offset, size):
+    """
+    Synchronously copies size bytes at offset, used when a chunk could not be
+    copied in a single linked read/write pair (short read or short write).
+    """
+    end = offset + size
+    while offset < end:
+        data = os.pread(in_fd, min(URING_CHUNK_SIZE, end - offset), offset)
+        if not data:
+            break
+        view = memoryview(data)
+        while view:
+            written = os.pwrite(out_fd, view, offset)
+            offset += written
+            view = view[written:]
+
+
+class IoUringBatchEngine:
+    """
+    Copies files through a single io_uring ring owned by a background thread.
+    Callers enqueue copies from any thread and block until theirs is done; the
+    ring thread opens queued files in batches, splits them into chunks and keeps
+    up to queue_depth linked read/write requests in flight per submit.
+    """
+
+    def __init__(self, queue_depth=URING_QUEUE_DEPTH):
+        if liburing is None:
+            raise RuntimeError("The liburing package is required for io_uring copies.")
+        self.queue_depth = max(2, queue_depth - queue_depth % 2)
+        self._jobs = queue.Queue()
+        # full-size chunk buffers, only touched by the ring thread and reused
+        # across batches; at most queue_depth / 2 of them are ever in flight
+        self._pool = []
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        """
+        Stops the ring thread once every queued copy is done.
+        """
+        self._jobs.put(None)
+        self._thread.join()
+
+    def copy2(self, src, dst):
+        """
+        Copies a file with its metadata like shutil.copy2.
+
+        Args:
+            src (str): Source file path.
+            dst (str): Target file path.
+        Returns:
+            None
+        """
+        job = _CopyJob(src, dst)
+        self._jobs.put(job)
+        job.future.result()
+        shutil.copystat(src, dst)
+
+    def _run(self):
+        ring = liburing.Ring()
+        cqe = liburing.Cqe()
+        liburing.io_uring_queue_init(self.queue_depth, ring)
+        try:
+            stop = False
+            while not stop:
+                job = self._jobs.get()
+                if job is None:
+                    break
+                jobs = [job]
+                while len(jobs) < URING_OPEN_BATCH:
+                    try:
+                        job = self._jobs.get_nowait()
+                    except queue.Empty:
+                        break
+                    if job is None:
+                        stop = True
+                        break
+                    jobs.append(job)
+                try:
+                    self._copy_batch(ring, cqe, jobs)
+                except Exception as e:
+                    for job in jobs:
+                        if not job.future.done():
+                            job.error = job.error or e
+                            self._finish(job)
+        finally:
+            liburing.io_uring_queue_exit(ring)
+            while True:
+                try:
+                    job = self._jobs.get_nowait()
+                except queue.Empty:
+                    break
+                if job is not None:
+                    job.future.set_exception(RuntimeError("io_uring engine closed."))
+
+    def _copy_batch(self, ring, cqe, jobs):
+        ops = deque()
+        for job in jobs:
+            try:
+                job.in_fd = os.open(job.src, os.O_RDONLY | os.O_CLOEXEC)
+                job.out_fd = os.open(
+                    job.dst, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | os.O_CLOEXEC, 0o666
+                )
+                size = os.fstat(job.in_fd).st_size
+            except OSError as e:
+                job.error = e
+                self._finish(job)
+                continue
+            for offset in range(0, size, URING_CHUNK_SIZE):
+                ops.append(UringOp(job, offset, min(URING_CHUNK_SIZE, size - offset)))
+                job.pending += 1
+            if job.pending == 0:
+                self._finish(job)
+
+        # full chunks take a buffer from the engine pool, allocated on first use;
+        # liburing uses the buffer length as the I/O size, so the last, shorter
+        # chunk of a file gets a buffer of its exact size.
+        pool = self._pool
+        in_flight = {}
+        next_id = 0
+        try:
+            while ops or in_flight:
+                queued = 0
+                while ops and 2 * (len(in_flight) + 1) <= self.queue_depth:
+                    op = ops.popleft()
+                    if op.size < URING_CHUNK_SIZE:
+                        op.buf = bytearray(op.size)
+                    elif pool:
+                        op.buf = pool.pop()
+                    else:
+                        op.buf = bytearray(URING_CHUNK_SIZE)
+                    in_flight[next_id] = op
+                    sqe = liburing.io_uring_get_sqe(ring)
+                    liburing.io_uring_prep_read(sqe, op.job.in_fd, op.buf, op.offset)
+                    liburing.io_uring_sqe_set_flags(sqe, liburing.IOSQE_IO_LINK)
+                    liburing.io_uring_sqe_set_data64(sqe, 2 * next_id)
+                    op.pending += 1
+                    sqe = liburing.io_uring_get_sqe(ring)
+                    liburing.io_uring_prep_write(sqe, op.job.out_fd, op.buf, op.offset)
+                    liburing.io_uring_sqe_set_data64(sqe, 2 * next_id + 1)
+                    op.pending += 1
+                    next_id += 1
+                    queued += 1
+                if queued:
+                    liburing.io_uring_submit(ring)
+
+                data, res, err = self._wait(ring, cqe)
+                op_id, is_write = divmod(data, 2)
+                op = in_flight[op_id]
+                op.pending -= 1
+                if op.job.error is None:
+                    if err is not None and err.errno != errno.ECANCELED:
+                        op.job.error = err
+                    elif is_write and (err is not None or res < op.size):
+                        # the read came back short and cancelled the linked write, or
+                        # the write itself was short: redo the chunk synchronously.
+                        try:
+                            _copy_range(op.job.in_fd, op.job.out_fd, op.offset, op.size)
+                        except OSError as e:
+                            op.job.error = e
+                if op.pending == 0:
+                    del in_flight[op_id]
+                    if len(op.buf) == URING_CHUNK_SIZE:
+                        pool.append(op.buf)
+                    op.buf = None
+                    op.job.pending -= 1
+                    if op.job.pending == 0:
+                        self._finish(op.job)
+        except BaseException:
+            # the kernel still owns the buffers and fds of the prepared requests:
+            # reap them all before the caller closes anything.
+            liburing.io_uring_submit(ring)
+            for _ in range(sum(op.pending for op in in_flight.values())):
+                self._wait(ring, cqe)
+            # buffers of the failed batch are not given back: start a fresh pool
+            pool.clear()
+            raise
+
+    @staticmethod
+    def _wait(ring, cqe):
+        """
+        Waits for one completion and marks it as seen.
+
+        Returns:
+            tuple: (user data, result or None, OSError or None).
+        """
+        liburing.io_uring_wait_cqe(ring, cqe)
+        entry = cqe[0]
+        data = liburing.io_uring_cqe_get_data64(entry)
+        try:
+            res = entry.res
+            err = None
+        except OSError as e:
+            res = None
+            err = e
+        liburing.io_uring_cqe_seen(ring, entry)
+        return data, res, err
+
+    @staticmethod
+    def _finish(job):
+        for fd in (job.in_fd, job.out_fd):
+            if fd is not None:
+                os.close(fd)
+        if job.error is None:
+            job.future.set_result(None)
+        else:
+            job.future.set_exception(job.error)
@@ -1,14 +1,129 @@
 import argparse
+import contextlib
+import errno
+import gzip
+import io
+import json
 import logging
 import os
 import shutil
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 
 from tqdm import tqdm
 
+import _uring
+from _statx import fast_stat
 
-def walk_folder(folder, ignore_files=None, ignore_extensions=None, ignore_hidden=True):
+COPY_CHUNK_SIZE = 2**30
+DEFAULT_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+PBAR_UPDATE_FILES = 256
+PBAR_UPDATE_BYTES = 64 * 1024 * 1024
+MANIFEST_FILENAME = "manifest.json.gz"
+MANIFEST_VERSION = 2
+MANIFEST_RACY_NS = 2 * 10**9
+_COPY_FALLBACK_ERRNOS = {
+    errno.EXDEV,
+    errno.ENOSYS,
+    errno.EINVAL,
+    errno.EOPNOTSUPP,
+    errno.ENOTSOCK,
+}
+
+_LINK_FALLBACK_ERRNOS = {errno.EXDEV, errno.EPERM, errno.EOPNOTSUPP}
+
+
+def _fadvise(fd, advice):
+    """
+    Gives the kernel an access pattern hint for a whole file, when supported.
+
+    Args:
+        fd (int): File descriptor.
+        advice (str): Name of the os.POSIX_FADV_* constant to use.
+    Returns:
+        None
+    """
+    if hasattr(os, "posix_fadvise"):
+        os.posix_fadvise(fd, 0, 0, getattr(os, advice))
+
+
+def _fast_copy2(src, dst):
+    """
+    Copies a file with its metadata like shutil.copy2, but moves the data inside
+    the kernel with os.copy_file_range, falling back to os.sendfile and then to a
+    plain read/write loop when the faster call is not supported.
+
+    Args:
+        src (str): Source file path.
+        dst (str): Target file path.
+    Returns:
+        None
+    """
+    in_fd = os.open(src, os.O_RDONLY | os.O_CLOEXEC)
+    try:
+        _fadvise(in_fd, "POSIX_FADV_SEQUENTIAL")
+        out_fd = os.open(
+            dst, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | os.O_CLOEXEC, 0o666
+        )
+        try:
+            copy_funcs = []
+            if hasattr(os, "copy_file_range"):
+                copy_funcs.append(
+                    lambda: os.copy_file_range(in_fd, out_fd, COPY_CHUNK_SIZE)
+                )
+            if hasattr(os, "sendfile"):
+                copy_funcs.append(
+                    lambda: os.sendfile(out_fd, in_fd, None, COPY_CHUNK_SIZE)
+                )
+
+            def read_write():
+                data = memoryview(os.read(in_fd, 1024 * 1024))
+                written = 0
+                while written < len(data):
+                    written += os.write(out_fd, data[written:])
+                return written
+
+            copy_funcs.append(read_write)
+
+            copy_func = copy_funcs.pop(0)
+            total_copied = 0
+            while True:
+                try:
+                    copied = copy_func()
+                except OSError as e:
+                    if e.errno not in _COPY_FALLBACK_ERRNOS or not copy_funcs:
+                        raise
+                    copy_func = copy_funcs.pop(0)
+                    continue
+                if copied == 0:
+                    # some filesystem / kernel combinations report 0 bytes copied
+                    # for non-empty files: try the next method before trusting EOF
+                    if total_copied == 0 and copy_funcs and os.fstat(in_fd).st_size > 0:
+                        copy_func = copy_funcs.pop(0)
+                        continue
+                    break
+                total_copied += copied
+        finally:
+            os.close(out_fd)
+        # the source has been read once and won't be needed again, don't let it
+        # evict the user's working set from the page cache
+        _fadvise(in_fd, "POSIX_FADV_DONTNEED")
+    finally:
+        os.close(in_fd)
+    shutil.copystat(src, dst)
+
+
+def walk_folder(
+    folder,
+    ignore_files=None,
+    ignore_extensions=None,
+    ignore_hidden=True,
+    manifest=None,
+    refresh_stats=True,
+    folders=None,
+    use_statx=False,
+):
     """
     Walks through a folder and returns a list of all relatives file paths within it.
 
@@ -17,43 +132,181 @@ def walk_folder(folder, ignore_files=None, ignore_extensions=None, ignore_hidden
         ignore_files (list): List of file paths or folders to ignore.
         ignore_extensions (list): List of file extensions to ignore.
         ignore_hidden (bool): If True, ignores hidden files and folders.
+        manifest (dict): Optional manifest from a previous walk (see load_manifest).
+            Directories whose mtime did not change since then are not listed again.
+            It is updated in place with the result of this walk.
+        refresh_stats (bool): If True, files of unchanged directories are still
+            stat'ed, only their listing is reused from the manifest.
+        folders (set): Optional set filled in place with the relative path of every
+            walked (non ignored) folder.
+        use_statx (bool): If True, stats files with statx(AT_STATX_DONT_SYNC), which
+            avoids revalidating attributes on network filesystems such as NFS.
     Returns:
-        list: List of file paths.
+        list: List of (relative file path, size in bytes, modification time in ns) tuples.
     """
-    file_paths = []
-    ignore_files = ignore_files or []
-    ignore_extensions = ignore_extensions or []
-
-    for root, dirs, files in os.walk(folder):
-        for d in dirs[::-1]:
-            rel_dir_path = os.path.relpath(os.path.join(root, d), folder)
+    ignore_set = {os.path.normpath(ign) for ign in ignore_files or []}
+    ignore_extensions = tuple(ignore_extensions or [])
+    sep = os.sep
+    pjoin = os.path.join
 
-            if ignore_hidden and d.startswith("."):
-                dirs.remove(d)
-                continue
+    if use_statx:
+        stat = fast_stat
+    else:
 
-            if any(
-                rel_dir_path == ign or rel_dir_path.startswith(os.path.join(ign, ""))
-                for ign in ignore_files
-            ):
-                dirs.remove(d)
-                continue
+        def stat(path):
+            st = os.stat(path)
+            return st.st_mode, st.st_size, st.st_mtime_ns, st.st_ctime_ns, st.st_ino
 
-        for file in files:
-            if ignore_hidden and file.startswith("."):
-                continue
+    if manifest is not None:
+        cached_dirs = manifest.get("dirs", {})
+        trusted_before_ns = manifest.get("scanned_at_ns", 0) - MANIFEST_RACY_NS
+        new_dirs = {}
 
-            relative_path = os.path.relpath(os.path.join(root, file), folder)
+    def list_dir(path, rel_prefix):
+        """
+        Lists a directory with os.scandir, reusing the cached entry type
+        instead of issuing a stat per entry. Files are stat'ed once so
+        callers never need to query their size or mtime again.
+        Args:
+            path (str): Absolute path of the directory to list.
+            rel_prefix (str): Relative path of the directory followed by a separator,
+                or an empty string for the root folder.
+        Returns:
+            tuple: (list of (file name, size, mtime in ns), list of sub-directory names).
+        """
+        files = []
+        dirs = []
+        with os.scandir(path) as it:
+            for entry in it:
+                if ignore_hidden and entry.name.startswith("."):
+                    continue
+
+                relative_path = rel_prefix + entry.name
+
+                if entry.is_dir(follow_symlinks=False):
+                    if relative_path in ignore_set:
+                        continue
+                    dirs.append(entry.name)
+                elif entry.is_file():
+                    if relative_path in ignore_set:
+                        continue
+
+                    if relative_path.endswith(ignore_extensions):
+                        continue
+
+                    if use_statx:
+                        _, size, mtime_ns, _, _ = stat(entry.path)
+                    else:
+                        st = entry.stat()
+                        size, mtime_ns = st.st_size, st.st_mtime_ns
+                    files.append((entry.name, size, mtime_ns))
+        return files, dirs
+
+    def scan(path, rel_prefix):
+        """
+        Recursively walks a directory, taking its listing from the manifest when
+        the directory mtime, ctime and inode are the ones recorded there. POSIX
+        updates a directory mtime and ctime on every create, unlink or rename
+        inside it. The mtime alone is not enough as tools like tar, rsync -a or
+        touch -d set it back, but the ctime cannot be set from userspace.
+        Directories changed too close to the previous walk are always listed
+        again, as their ctime may not have ticked.
+        Args:
+            path (str): Absolute path of the directory to walk.
+            rel_prefix (str): Relative path of the directory followed by a separator,
+                or an empty string for the root folder.
+        Yields:
+            tuple: (relative file path, size in bytes, modification time in ns).
+        """
+        if manifest is None:
+            files, dirs = list_dir(path, rel_prefix)
+        else:
+            _, _, dir_mtime_ns, dir_ctime_ns, dir_ino = stat(path)
+            cached = cached_dirs.get(rel_prefix)
+            files = None
+            if (
+                cached is not None
+                and cached["mtime_ns"] == dir_mtime_ns
+                and cached["ctime_ns"] == dir_ctime_ns
+                and cached["ino"] == dir_ino
+                and dir_ctime_ns < trusted_before_ns
+            ):
+                files, dirs = cached["files"], cached["dirs"]
+                if refresh_stats:
+                    try:
+                        files = [
+                            (name, *stat(pjoin(path, name))[1:3])
+                            for name, _, _ in files
+                        ]
+                    except FileNotFoundError:
+                        # the cached listing is stale after all, list it again
+                        files = None
+            if files is None:
+                files, dirs = list_dir(path, rel_prefix)
+            new_dirs[rel_prefix] = {
+                "mtime_ns": dir_mtime_ns,
+                "ctime_ns": dir_ctime_ns,
+                "ino": dir_ino,
+                "files": files,
+                "dirs": dirs,
+            }
+
+        for name, size, mtime_ns in files:
+            yield rel_prefix + name, size, mtime_ns
+        for name in dirs:
+            if folders is not None:
+                folders.add(rel_prefix + name)
+            yield from scan(pjoin(path, name), rel_prefix + name + sep)
+
+    scanned_at_ns = time.time_ns()
+    file_paths = list(scan(folder, ""))
+    if manifest is not None:
+        manifest["scanned_at_ns"] = scanned_at_ns
+        manifest["dirs"] = new_dirs
+    return file_paths
 
-            if any(relative_path == ign for ign in ignore_files):
-                continue
 
-            if any(relative_path.endswith(ext) for ext in ignore_extensions):
-                continue
+def load_manifest(folder, options):
+    """
+    Loads the manifest saved by a previous sync of a folder.
 
-            file_paths.append(relative_path)
+    Args:
+        folder (str): Path to the folder.
+        options (list): Walk options the manifest must have been built with.
+    Returns:
+        dict: The manifest, or an empty one if missing, unreadable or built with other options.
+    """
+    manifest_path = os.path.join(folder, ".sync_logs", MANIFEST_FILENAME)
+    try:
+        with gzip.open(manifest_path, "rt") as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return {"options": options}
+    if (
+        manifest.get("version") != MANIFEST_VERSION
+        or manifest.get("options") != options
+    ):
+        return {"options": options}
+    for entry in manifest["dirs"].values():
+        entry["files"] = [tuple(f) for f in entry["files"]]
+    return manifest
+
+
+def save_manifest(folder, manifest):
+    """
+    Saves a manifest in the .sync_logs folder, replacing the previous one atomically.
 
-    return file_paths
+    Args:
+        folder (str): Path to the folder.
+        manifest (dict): Manifest updated by walk_folder.
+    Returns:
+        None
+    """
+    manifest_path = os.path.join(folder, ".sync_logs", MANIFEST_FILENAME)
+    tmp_path = manifest_path + ".tmp"
+    with gzip.open(tmp_path, "wt") as f:
+        json.dump({**manifest, "version": MANIFEST_VERSION}, f, sort_keys=True)
+    os.replace(tmp_path, manifest_path)
 
 
 def sync_folders(
@@ -63,6 +316,10 @@ def sync_folders(
     ignore_files=None,
     ignore_extensions=None,
     ignore_hidden=True,
+    workers=DEFAULT_WORKERS,
+    use_io_uring=False,
+    use_manifest=False,
+    use_statx=False,
 ):
     """
     Syncs files between two folders, ensuring both folders have the same files.
@@ -75,135 +332,263 @@ def sync_folders(
         ignore_filess (list): Paths to files or folders containing list of files to ignore during sync.
         ignore_extensions (list): List of file extensions to ignore during sync.
         ignore_hidden (bool): If True, ignores hidden files and folders during sync.
+        workers (int): Number of threads used to copy files concurrently.
+        use_io_uring (bool): If True, copies file data through io_uring (requires liburing).
+        use_manifest (bool): If True, reuses the listings of unchanged directories from the previous sync.
+        use_statx (bool): If True, stats files with statx(AT_STATX_DONT_SYNC) (useful on NFS).
     Returns:
         list: List of synced file paths.
     """
 
-    def loop_folder(rootA, rootB):
-        """
-        Loops through folderA and create folder in rootB if not exists.
-        Args:
-            rootA (str): Source folder path.
-            rootB (str): Target folder path.
-        Returns:
-            None
-        """
-        for root, dirs, _ in os.walk(rootA):
-            for d in dirs:
-                rel_dir_path = os.path.relpath(os.path.join(root, d), rootA)
-                target_dir_path = os.path.join(rootB, rel_dir_path)
-                if not os.path.exists(target_dir_path):
-                    os.makedirs(target_dir_path, exist_ok=True)
-
-    logging.info(f"Copying arborescence structure between {folderA} and {folderB}...")
-    loop_folder(folderA, folderB)
-    loop_folder(folderB, folderA)
     logging.info("Walking through folders to get file lists...")
-    folderA_files = walk_folder(folderA, ignore_files, ignore_extensions, ignore_hidden)
-    folderB_files = walk_folder(folderB, ignore_files, ignore_extensions, ignore_hidden)
+    manifest_A = manifest_B = None
+    if use_manifest:
+        options = [
+            sorted(os.path.normpath(ign) for ign in ignore_files or []),
+            list(ignore_extensions or []),
+            ignore_hidden,
+        ]
+        manifest_A = load_manifest(folderA, options)
+        manifest_B = load_manifest(folderB, options)
+    dirsA = set()
+    dirsB = set()
+    folderA_files = walk_folder(
+        folderA,
+        ignore_files,
+        ignore_extensions,
+        ignore_hidden,
+        manifest=manifest_A,
+        refresh_stats=sync_most_recent,
+        folders=dirsA,
+        use_statx=use_statx,
+    )
+    folderB_files = walk_folder(
+        folderB,
+        ignore_files,
+        ignore_extensions,
+        ignore_hidden,
+        manifest=manifest_B,
+        refresh_stats=sync_most_recent,
+        folders=dirsB,
+        use_statx=use_statx,
+    )
 
-    def get_total_size(files, root):
+    def make_folders(folders, root):
         """
-        Calculates the total size of a list of files in bytes.
+        Creates folders in root, parents first.
         Args:
-            files (list): List of file paths.
+            folders (set): Relative paths of the folders to create.
             root (str): Root folder path.
         Returns:
-            int: Total size in bytes.
+            tuple: Relative paths, with a trailing separator, of the folders skipped because a file is in the way.
         """
-        total = 0
-        for f in tqdm(files, desc="Calculating total size", leave=False, unit="files"):
-            total += os.path.getsize(os.path.join(root, f))
-        return total
+        skipped = set()
+        for d in sorted(folders, key=lambda d: d.count(os.sep)):
+            if os.path.dirname(d) in skipped:
+                skipped.add(d)
+                continue
+            try:
+                os.makedirs(os.path.join(root, d), exist_ok=True)
+            except FileExistsError:
+                logging.warning(
+                    f"Skipping folder {os.path.join(root, d)}: a file with the same name exists."
+                )
+                skipped.add(d)
+        return tuple(os.path.join(d, "") for d in skipped)
 
-    def loop_files(files, rootA, rootB, total_size=None):
+    logging.info(f"Copying arborescence structure between {folderA} and {folderB}...")
+    skipped_B = make_folders(dirsA - dirsB, folderB)
+    skipped_A = make_folders(dirsB - dirsA, folderA)
+
+    def loop_files(files, rootA, rootB):
         """
-        Loops through files and syncs them from rootA to rootB.
+        Loops through files and copies them from rootA to rootB.
         Args:
-            files (list): List of file paths to sync.
+            files (list): List of (file path, size, status) tuples to copy.
             rootA (str): Source folder path.
             rootB (str): Target folder path.
-            total_size (int): Total size of files to sync in bytes.
         Returns:
             list: List of synced file paths. (file, status).
         """
-        as_been_synced = []
-        with tqdm(
-            total=total_size,
+        engine = _uring.IoUringBatchEngine() if use_io_uring else None
+        copy2 = engine.copy2 if engine else _fast_copy2
+
+        rootA_sep = os.path.join(rootA, "")
+        rootB_sep = os.path.join(rootB, "")
+
+        skipped_files = set()
+
+        def _copy_one(file):
+            try:
+                copy2(rootA_sep + file, rootB_sep + file)
+            except FileNotFoundError:
+                # the source disappeared since the walk (or was listed from a stale
+                # manifest): nothing to copy, but not a reason to abort the sync
+                if os.path.lexists(rootA_sep + file):
+                    raise
+                logging.warning(f"Skipping {rootA_sep + file}: it no longer exists.")
+                skipped_files.add(file)
+            except IsADirectoryError:
+                # the target is a symlink to a folder, which the walk does not list
+                logging.warning(
+                    f"Skipping {rootA_sep + file}: {rootB_sep + file} is a folder."
+                )
+                skipped_files.add(file)
+
+        # the engine is listed first so that it is closed last, once the executor
+        # has waited for every copy, even when one of them raised
+        with engine or contextlib.nullcontext(), tqdm(
+            total=sum(size for _, size, _ in files),
             desc=f"Syncing to {rootB}",
             unit="B",
             unit_scale=True,
             unit_divisor=1024,
-        ) as pbar:
-            for file in files:
-                file_path = os.path.join(rootA, file)
-                target_path = os.path.join(rootB, file)
-
-                if not os.path.exists(target_path):
-                    os.makedirs(os.path.dirname(target_path), exist_ok=True)
-                    shutil.copy2(file_path, target_path)
-                    as_been_synced.append((file, "new"))
-                elif sync_most_recent:
-                    if os.path.getmtime(file_path) > os.path.getmtime(target_path):
-                        shutil.copy2(file_path, target_path)
-                        as_been_synced.append((file, "more recent"))
-                pbar.update(os.path.getsize(file_path))
-        return as_been_synced
+            mininterval=0.5,
+        ) as pbar, ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {
+                executor.submit(_copy_one, file): size for file, size, _ in files
+            }
+            files_done = bytes_done = 0
+            try:
+                for future in as_completed(futures):
+                    future.result()
+                    files_done += 1
+                    bytes_done += futures[future]
+                    if (
+                        files_done >= PBAR_UPDATE_FILES
+                        or bytes_done >= PBAR_UPDATE_BYTES
+                    ):
+                        pbar.update(bytes_done)
+                        files_done = bytes_done = 0
+            except BaseException:
+                # stop at the first error like a sequential copy would: only the
+                # copies already running are waited for by the executor exit
+                for future in futures:
+                    future.cancel()
+                raise
+            pbar.update(bytes_done)
+        return [
+            (file, status) for file, _, status in files if file not in skipped_files
+        ]
+
+    if use_io_uring and not _uring.available():
+        logging.warning(
+            "A supported liburing is not installed, copying without io_uring."
+        )
+        use_io_uring = False
+
+    stats_A = {file: (size, mtime) for file, size, mtime in folderA_files}
+    stats_B = {file: (size, mtime) for file, size, mtime in folderB_files}
+
+    for file in sorted((stats_A.keys() & dirsB) | (stats_B.keys() & dirsA)):
+        logging.warning(
+            f"Skipping {file}: it is a file on one side, a folder on the other."
+        )
+
+    to_copy_A_to_B = [
+        (file, stats_A[file][0], "new")
+        for file in sorted(stats_A.keys() - stats_B.keys() - dirsB)
+        if not file.startswith(skipped_B)
+    ]
+    to_copy_B_to_A = [
+        (file, stats_B[file][0], "new")
+        for file in sorted(stats_B.keys() - stats_A.keys() - dirsA)
+        if not file.startswith(skipped_A)
+    ]
+    if sync_most_recent:
+        for file in sorted(stats_A.keys() & stats_B.keys()):
+            size_A, mtime_A = stats_A[file]
+            size_B, mtime_B = stats_B[file]
+            if mtime_A > mtime_B:
+                to_copy_A_to_B.append((file, size_A, "more recent"))
+            elif mtime_B > mtime_A:
+                to_copy_B_to_A.append((file, size_B, "more recent"))
+            elif size_A != size_B:
+                # same mtime but different content: neither is more recent, folderA wins
+                logging.warning(f"Conflict on {file}: same mtime, different sizes.")
+                to_copy_A_to_B.append((file, size_A, "conflict"))
 
     logging.info("Starting sync process...")
     start = time.time()
-    synced_A_to_B = loop_files(
-        folderA_files,
-        folderA,
-        folderB,
-        total_size=get_total_size(folderA_files, folderA),
-    )
-    synced_B_to_A = loop_files(
-        folderB_files,
-        folderB,
-        folderA,
-        total_size=get_total_size(folderB_files, folderB),
-    )
+    synced_A_to_B = loop_files(to_copy_A_to_B, folderA, folderB)
+    synced_B_to_A = loop_files(to_copy_B_to_A, folderB, folderA)
 
     full_time = time.time() - start
     logging.info(f"Sync completed in {full_time} :) Saving logs...")
 
     log_filename = datetime.now().strftime("%Y-%m-%d_%H:%M:%S") + "_sync.log"
-    if not os.path.exists(os.path.join(folderA, ".sync_logs")):
-        os.makedirs(os.path.join(folderA, ".sync_logs"))
-    if not os.path.exists(os.path.join(folderB, ".sync_logs")):
-        os.makedirs(os.path.join(folderB, ".sync_logs"))
+    os.makedirs(os.path.join(folderA, ".sync_logs"), exist_ok=True)
+    os.makedirs(os.path.join(folderB, ".sync_logs"), exist_ok=True)
+    if use_manifest:
+        save_manifest(folderA, manifest_A)
+        save_manifest(folderB, manifest_B)
+
+    log_path_A = os.path.join(folderA, ".sync_logs", log_filename)
+    log_path_B = os.path.join(folderB, ".sync_logs", log_filename)
 
-    with open(os.path.join(folderA, ".sync_logs", log_filename), "w") as log_file:
+    with io.StringIO() as log_file:
         log_file.write("Parameters:\n")
         log_file.write(f"  folderA: {folderA}\n")
         log_file.write(f"  folderB: {folderB}\n")
         log_file.write(f"  sync_most_recent: {sync_most_recent}\n")
         log_file.write(f"  ignore_files: {ignore_files}\n")
         log_file.write(f"  ignore_extensions: {ignore_extensions}\n")
-        log_file.write(f"  ignore_hidden: {ignore_hidden}\n\n")
+        log_file.write(f"  ignore_hidden: {ignore_hidden}\n")
+        log_file.write(f"  workers: {workers}\n")
+        log_file.write(f"  io_uring: {use_io_uring}\n")
+        log_file.write(f"  manifest: {use_manifest}\n")
+        log_file.write(f"  statx: {use_statx}\n\n")
         log_file.write(
             f"Synced {len(folderA_files) + len(folderB_files)} files ({len(synced_A_to_B) + len(synced_B_to_A)} copied) between {folderA} and {folderB} in {full_time} seconds.\n\n"
         )
-        for file, status in synced_A_to_B:
-            log_file.write(
-                f"Because of '{status}': {os.path.join(folderA, file)} ==> {os.path.join(folderB, file)}\n"
-            )
-        for file, status in synced_B_to_A:
-            log_file.write(
-                f"Because of '{status}': {os.path.join(folderB, file)} ==> {os.path.join(folderA, file)}\n"
-            )
-    # with open(os.path.join(folderA, ".sync_logs", log_filename), "r") as log_file:
-    #     logging.info(log_file.read())
-
-    shutil.copy2(
-        os.path.join(folderA, ".sync_logs", log_filename),
-        os.path.join(folderB, ".sync_logs", log_filename),
-    )
+        folderA_sep = os.path.join(folderA, "")
+        folderB_sep = os.path.join(folderB, "")
+        log_file.writelines(
+            f"Because of '{status}': {folderA_sep}{file} ==> {folderB_sep}{file}\n"
+            for file, status in synced_A_to_B
+        )
+        log_file.writelines(
+            f"Because of '{status}': {folderB_sep}{file} ==> {folderA_sep}{file}\n"
+            for file, status in synced_B_to_A
+        )
+        log_content = log_file.getvalue()
+    # a log with the same name may already exist (two syncs within a second) and
+    # be hard-linked between both folders: always write and link to temporary
+    # names then os.replace, so an existing log is never truncated in place.
+    tmp_path_A = log_path_A + ".tmp"
+    tmp_path_B = log_path_B + ".tmp"
+    with open(tmp_path_A, "w") as f:
+        f.write(log_content)
+    os.replace(tmp_path_A, log_path_A)
+
+    try:
+        os.remove(tmp_path_B)
+    except FileNotFoundError:
+        pass
+    try:
+        os.link(log_path_A, tmp_path_B)
+    except OSError as e:
+        if e.errno not in _LINK_FALLBACK_ERRNOS:
+            raise
+        shutil.copy2(log_path_A, tmp_path_B)
+    os.replace(tmp_path_B, log_path_B)
+
+    logging.info(f"Logs saved to {log_path_A} and {log_path_B}.")
+
+
+def _positive_int(value):
+    """
+    Argparse type for options that must be strictly positive integers.
 
-    logging.info(
-        f"Logs saved to {os.path.join(folderA, '.sync_logs', log_filename)} and {os.path.join(folderB, '.sync_logs', log_filename)}."
-    )
+    Args:
+        value (str): Raw command line value.
+    Returns:
+        int: The parsed value.
+    """
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"{value} is not a positive integer.")
+    return number
 
 
 if __name__ == "__main__":
@@ -242,6 +627,30 @@ if __name__ == "__main__":
         default=True,
         help="Ignore hidden files and folders during sync.",
     )
+    parser.add_argument(
+        "--workers",
+        type=_positive_int,
+        default=DEFAULT_WORKERS,
+        help="Number of threads used to copy files concurrently.",
+    )
+    parser.add_argument(
+        "--io_uring",
+        action="store_true",
+        default=False,
+        help="Copy file data through io_uring (requires the liburing package).",
+    )
+    parser.add_argument(
+        "--manifest",
+        action="store_true",
+        default=False,
+        help="Reuse the listings of folders unchanged since the previous sync.",
+    )
+    parser.add_argument(
+        "--statx",
+        action="store_true",
+        default=False,
+        help="Stat files with statx(AT_STATX_DONT_SYNC), faster on network filesystems.",
+    )
 
     args = parser.parse_args()
     if os.path.exists(args.A) is False:
@@ -263,6 +672,10 @@ if __name__ == "__main__":
     logging.info(f"  ignore_files: {ignore_files}")
     logging.info(f"  ignore_extensions: {ignore_extensions}")
     logging.info(f"  ignore_hidden: {ignore_hidden}")
+    logging.info(f"  workers: {args.workers}")
+    logging.info(f"  io_uring: {args.io_uring}")
+    logging.info(f"  manifest: {args.manifest}")
+    logging.info(f"  statx: {args.statx}")
 
     sync_folders(
         args.A,
@@ -271,4 +684,8 @@ if __name__ == "__main__":
         ignore_files=ignore_files,
         ignore_extensions=ignore_extensions,
         ignore_hidden=ignore_hidden,
+        workers=args.workers,
+        use_io_uring=args.io_uring,
+        use_manifest=args.manifest,
+        use_statx=args.statx,
     )